@@ -2,10 +2,12 @@
 
 import math
 
-import random
+import os
 
 import sys
 
+import zlib
+
 from dataclasses import dataclass
 
 from typing import List, Tuple
@@ -16,11 +18,27 @@ import numpy as np
 
 
 
+try:
+
+    from numba import njit
+
+except ImportError:  # numba is optional; the kernels below are plain NumPy without it
+
+    def njit(*args, **kwargs):
+
+        if args and callable(args[0]):
+
+            return args[0]
+
+        return lambda fn: fn
+
+
+
 from PySide6 import QtCore, QtWidgets, QtGui
 
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QByteArray
 
-from PySide6.QtGui import QVector3D, QColor
+from PySide6.QtGui import QVector3D, QColor, QMatrix4x4
 
 from PySide6.QtWidgets import QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QPushButton, QLabel, QComboBox, QSpinBox, QSlider, QLineEdit
 
@@ -32,12 +50,70 @@ from PySide6 import Qt3DCore, Qt3DExtras, Qt3DRender, Qt3DInput
 
 
 
+# The instanced cubelet material ships GLSL 3.30, so pin Qt3D to its OpenGL renderer
+
+os.environ.setdefault('QT3D_RENDERER', 'opengl')
+
+
+
 
 
 U, D, F, B, L, R = 1, 2, 4, 8, 16, 32
 
 
 
+AXES = ('x', 'y', 'z')
+
+AXIS_INDEX = {'x': 0, 'y': 1, 'z': 2}
+
+AXIS_VEC = {'x': QVector3D(1,0,0), 'y': QVector3D(0,1,0), 'z': QVector3D(0,0,1)}
+
+
+
+# Column pair (a,b) rotated by each axis: new_a = c*a - s*b, new_b = s*a + c*b.
+
+# 'y' uses (z,x) rather than (x,z) so all three share the same sign pattern.
+
+ROT_COLS = {'x': (1,2), 'y': (2,0), 'z': (0,1)}
+
+
+
+# Exact quarter-turn kernels on grid columns (ca,cb) for cubelets `idx`, in place; m = n-1
+
+@njit(cache=True)
+
+def _turn_1(ca, cb, idx, m):
+
+    ua = ca[idx]; ub = cb[idx]
+
+    ca[idx] = m - ub; cb[idx] = ua
+
+
+
+@njit(cache=True)
+
+def _turn_2(ca, cb, idx, m):
+
+    ca[idx] = m - ca[idx]; cb[idx] = m - cb[idx]
+
+
+
+@njit(cache=True)
+
+def _turn_3(ca, cb, idx, m):
+
+    ua = ca[idx]; ub = cb[idx]
+
+    ca[idx] = ub; cb[idx] = m - ua
+
+
+
+# Quarter-turn count -> kernel, resolved once per commit instead of branching inside
+
+PERMUTE_FNS = {1: _turn_1, 2: _turn_2, 3: _turn_3}
+
+
+
 @dataclass
 
 class Move:
@@ -96,6 +172,34 @@ def blend_colors(bits: int) -> QColor:
 
 
 
+# Same palette as blend_colors, as a (64,3) lookup indexed directly by face mask
+
+FACE_BITS = np.array([U, D, F, B, L, R], dtype=np.uint8)
+
+FACE_RGB = np.array([[0xff,0xd6,0x0a], [0xff,0xff,0xff], [0x00,0xa6,0x51],
+
+                     [0x00,0x57,0xff], [0xff,0x8c,0x00], [0xff,0x00,0x30]], dtype=np.float32) / 255.0
+
+
+
+def _build_color_table() -> np.ndarray:
+
+    table = np.empty((64,3), dtype=np.float32)
+
+    for m in range(64):
+
+        sel = (m & FACE_BITS).astype(bool)
+
+        table[m] = FACE_RGB[sel].mean(axis=0) if sel.any() else 0x11/255.0
+
+    return table
+
+
+
+COLOR_TABLE = _build_color_table()
+
+
+
 class VoxelRubiks:
 
     """Outer-shell cubelets only; each cubelet keeps its own color/mask and moves in 3D integer grid."""
@@ -108,75 +212,105 @@ class VoxelRubiks:
 
         self.half = (n-1)/2.0
 
-        # Build outer coordinates and initial face mask per cubelet (order is stable)
+        self._half32 = np.float32(self.half)  # exact: half is a multiple of 0.5
 
-        self.coords = []  # list of (x,y,z) integers per cubelet (entity order)
+        # Outer-shell cubelets in z,y,x scan order (x fastest), with their initial face masks
 
-        self.masks  = []  # corresponding bitmask (color) per cubelet
+        dtype = np.int8 if n <= 128 else np.int16
 
-        for z in range(n):
+        ar = np.arange(n, dtype=dtype)
 
-            for y in range(n):
+        zs, ys, xs = np.meshgrid(ar, ar, ar, indexing='ij')
 
-                for x in range(n):
+        lo = [xs==0, ys==0, zs==0]; hi = [xs==n-1, ys==n-1, zs==n-1]
 
-                    if x in (0,n-1) or y in (0,n-1) or z in (0,n-1):
+        outer = lo[0] | hi[0] | lo[1] | hi[1] | lo[2] | hi[2]
 
-                        self.coords.append([x,y,z])
+        masks = (lo[2]*U | hi[2]*D | lo[1]*F | hi[1]*B | lo[0]*L | hi[0]*R)
 
-                        mask = 0
+        # Axis-major (3,M) layout: each axis is one C-contiguous row, so slice scans
 
-                        if z==0:     mask |= U
+        # and permutations touch a single packed run; cx/cy/cz are views of the rows
 
-                        if z==n-1:   mask |= D
+        self.coords_t = np.ascontiguousarray(np.stack([xs[outer], ys[outer], zs[outer]]))
 
-                        if y==0:     mask |= F
+        self.cx, self.cy, self.cz = self.coords_t
 
-                        if y==n-1:   mask |= B
+        self.masks  = masks[outer].astype(np.uint8)
 
-                        if x==0:     mask |= L
+        self.solved = self.coords.copy()
 
-                        if x==n-1:   mask |= R
+        self.history: List[Move] = []
 
-                        self.masks.append(mask)
+        # _slice_of[axis_idx][i] -> int32 cubelet indices currently in that slice
 
-        self.coords = np.array(self.coords, dtype=np.int16)  # shape (M,3)
+        self._slice_of = [[], [], []]
 
-        self.masks  = np.array(self.masks, dtype=np.uint8)
+        self._rebuild_slice_tables()
 
-        self.solved = self.coords.copy()
+        # Gather scratch sized for the largest slice (a full n*n face)
 
-        self.history: List[Move] = []
+        self._scratch_col = np.empty(n*n, dtype=dtype)
 
 
 
-    def reset(self):
+    @property
 
-        self.coords[:] = self.solved
+    def coords(self) -> np.ndarray:
 
-        self.history.clear()
+        """(M,3) view of coords_t, for callers that want one row per cubelet."""
 
+        return self.coords_t.T
 
 
-    def scramble(self, moves=24, seed=None):
 
-        if seed is not None:
+    def _col(self, ax: int) -> np.ndarray:
+
+        return self.coords_t[ax]
+
+
+
+    def centered_positions(self, idx: np.ndarray, out: np.ndarray) -> np.ndarray:
+
+        """Write centered (x,y,z) of cubelets `idx` into out[:len(idx)] without allocating."""
+
+        cnt = len(idx)
+
+        tmp = self._scratch_col[:cnt]
+
+        for ax in range(3):
+
+            np.take(self._col(ax), idx, out=tmp)
+
+            np.subtract(tmp, self._half32, out=out[:cnt,ax])
+
+        return out[:cnt]
+
+
+
+    def reset(self):
+
+        self.coords_t[:] = self.solved.T
+
+        self._rebuild_slice_tables()
 
-            random.seed(seed)
+        self.history.clear()
 
-        axes = ['x','y','z']
 
-        seq = []
 
-        for _ in range(moves):
+    def scramble(self, moves=24, seed=None):
+
+        # Draw the whole sequence in three vectorized calls (seed=None -> fresh entropy)
 
-            axis = random.choice(axes)
+        rng = np.random.default_rng(seed)
 
-            index = random.randint(0, self.n-1)
+        axes = rng.integers(0, 3, moves)
 
-            k = random.choice([1,2,3])
+        idxs = rng.integers(0, self.n, moves)
 
-            seq.append(Move(axis,index,k))
+        ks = rng.integers(1, 4, moves)
+
+        seq = [Move(AXES[a], int(i), int(k)) for a, i, k in zip(axes, idxs, ks)]
 
         self.history.extend(seq)
 
@@ -186,27 +320,47 @@ class VoxelRubiks:
 
     def inverse_history(self) -> List[Move]:
 
-        inv = []
+        inv = [(m.axis, m.index, (4 - (m.k % 4)) % 4) for m in reversed(self.history)]
+
+        # Compact: fold neighbouring turns of the same slice, dropping ones that cancel out
+
+        out: List[Move] = []
+
+        for axis, index, k in inv:
 
-        for m in reversed(self.history):
+            if out and out[-1].axis == axis and out[-1].index == index:
 
-            inv_k = (4 - (m.k % 4)) % 4
+                out[-1].k = (out[-1].k + k) % 4
 
-            if inv_k:
+                if not out[-1].k:
 
-                inv.append(Move(m.axis, m.index, inv_k))
+                    out.pop()
 
-        return inv
+            elif k:
 
+                out.append(Move(axis, index, k))
 
+        return out
 
-    def _slice_mask(self, axis, index):
 
-        if axis=='x': return (self.coords[:,0]==index)
 
-        if axis=='y': return (self.coords[:,1]==index)
+    def _rebuild_slice_tables(self, skip=None):
 
-        return (self.coords[:,2]==index)
+        """Bucket cubelet indices by coordinate on each axis (axis `skip` is left as is)."""
+
+        for ax in range(3):
+
+            if ax == skip:
+
+                continue
+
+            col = self._col(ax)
+
+            order = np.argsort(col, kind='stable').astype(np.int32)
+
+            bounds = np.cumsum(np.bincount(col, minlength=self.n))[:-1]
+
+            self._slice_of[ax] = np.split(order, bounds)
 
 
 
@@ -214,83 +368,295 @@ class VoxelRubiks:
 
         """Commit a 90° rotation for the slice; updates integer coords in-place."""
 
-        mask = self._slice_mask(axis, index)
+        self._rotate_slice_k(axis, index, 1 if dir_sign > 0 else 3)
+
+
+
+    def _rotate_slice_k(self, axis, index, k):
+
+        """Commit k quarter-turns at once as an exact permutation of the grid columns."""
+
+        k %= 4
+
+        if not k:
+
+            return
+
+        ax = AXIS_INDEX[axis]
+
+        # (a,b) -> (m-b, a) per quarter-turn; a half-turn reflects both columns
+
+        a, b = ROT_COLS[axis]
+
+        PERMUTE_FNS[k](self._col(a), self._col(b), self._slice_of[ax][index], self.n - 1)
+
+        # Turning about an axis keeps that axis' slices intact
+
+        self._rebuild_slice_tables(skip=ax)
+
+
+
+# Per-instance cubelet shaders: one unit cube, scaled and offset by instance attributes
+
+INSTANCED_VERT = """
+
+#version 330 core
+
+in vec3 vertexPosition;
+
+in vec3 vertexNormal;
+
+in vec3 instancePosition;
+
+in float instanceMask;
+
+out vec3 worldPosition;
+
+out vec3 worldNormal;
+
+out vec3 color;
+
+uniform mat4 modelViewProjection;
+
+uniform float cubeletScale;
+
+uniform vec3 palette[64];
+
+uniform mat4 sliceRotation;
+
+uniform vec3 sliceAxis;
+
+uniform float sliceCoord;
+
+void main()
+
+{
 
-        pts = self.coords[mask].astype(np.float64)
+    // Slice membership comes from the instance's own grid position, so starting a
 
-        pts -= self.half
+    // turn needs no per-instance upload; the whole slice shares one rotation
 
-        a = dir_sign * (math.pi/2.0)
+    bool moving = abs(dot(instancePosition, sliceAxis) - sliceCoord) < 0.25;
 
-        c, s = math.cos(a), math.sin(a)
+    mat4 r = moving ? sliceRotation : mat4(1.0);
 
-        if axis=='x':
+    worldPosition = (r * vec4(vertexPosition * cubeletScale + instancePosition, 1.0)).xyz;
 
-            y = pts[:,1].copy(); z = pts[:,2].copy()
+    worldNormal = mat3(r) * vertexNormal;
 
-            pts[:,1] = c*y - s*z
+    color = palette[int(instanceMask)];
 
-            pts[:,2] = s*y + c*z
+    gl_Position = modelViewProjection * vec4(worldPosition, 1.0);
 
-        elif axis=='y':
+}
 
-            x = pts[:,0].copy(); z = pts[:,2].copy()
+"""
 
-            pts[:,0] =  c*x + s*z
 
-            pts[:,2] = -s*x + c*z
 
-        else: # 'z'
+INSTANCED_FRAG = """
 
-            x = pts[:,0].copy(); y = pts[:,1].copy()
+#version 330 core
 
-            pts[:,0] = c*x - s*y
+in vec3 worldPosition;
 
-            pts[:,1] = s*x + c*y
+in vec3 worldNormal;
 
-        snapped = np.rint(pts + self.half).astype(np.int16)
+in vec3 color;
 
-        self.coords[mask] = snapped
+out vec4 fragColor;
 
+uniform vec3 lightPosition;
 
+uniform vec3 eyePosition;
 
-class CubeletEntity:
+void main()
 
-    """Holds per-cubelet Transform and color; shares a global mesh for performance."""
+{
 
-    def __init__(self, parent_entity: Qt3DCore.QEntity, mesh: Qt3DExtras.QCuboidMesh, color: QColor, pos: Tuple[float,float,float], scale: float=0.92):
+    vec3 n = normalize(worldNormal);
+
+    vec3 l = normalize(lightPosition - worldPosition);
+
+    vec3 v = normalize(eyePosition - worldPosition);
+
+    float diffuse = max(dot(n, l), 0.0);
+
+    float specular = pow(max(dot(reflect(-l, n), v), 0.0), 150.0);
+
+    fragColor = vec4(color * (0.3 + 0.9 * diffuse) + vec3(0.25 * specular), 1.0);
+
+}
+
+"""
+
+
+
+class CubeletInstances:
+
+    """All cubelets as one instanced draw; positions/masks live in NumPy arrays mirrored to GPU buffers."""
+
+    def __init__(self, parent_entity: Qt3DCore.QEntity, positions: np.ndarray, masks: np.ndarray, palette: np.ndarray, light_pos: QVector3D, scale: float=0.92):
+
+        self.positions = np.ascontiguousarray(positions, dtype=np.float32)  # (M,3) centered translations
+
+        # (M,) face mask -> palette row; float32 because Qt3D normalizes byte attributes
+
+        self.masks = np.ascontiguousarray(masks, dtype=np.float32)
 
         self.entity = Qt3DCore.QEntity(parent_entity)
 
-        self.transform = Qt3DCore.QTransform()
+        self.geometry = Qt3DExtras.QCuboidGeometry(self.entity)
+
+        self.posBuffer = self._add_instance_attribute('instancePosition', self.positions)
+
+        self.maskBuffer = self._add_instance_attribute('instanceMask', self.masks)
 
-        self.material = Qt3DExtras.QPhongMaterial(self.entity)
+        self.renderer = Qt3DRender.QGeometryRenderer(self.entity)
 
-        self.material.setAmbient(color)
+        self.renderer.setGeometry(self.geometry)
 
-        self.material.setDiffuse(color)
+        self.renderer.setPrimitiveType(Qt3DRender.QGeometryRenderer.Triangles)
 
-        self.entity.addComponent(mesh)
+        self.renderer.setInstanceCount(len(self.positions))
+
+        self.material = self._make_material(palette, light_pos, scale)
+
+        self.entity.addComponent(self.renderer)
 
         self.entity.addComponent(self.material)
 
-        self.entity.addComponent(self.transform)
+        # Resolve bindings once: updateData for commit/reset uploads, setValue for the per-frame rotation
+
+        self._update_pos = self.posBuffer.updateData
+
+        self._row = self.positions.strides[0]
+
+        self._set_rotation = self._rotParam.setValue
+
+
+
+    def _add_instance_attribute(self, name: str, data: np.ndarray) -> Qt3DCore.QBuffer:
+
+        buf = Qt3DCore.QBuffer(self.geometry)
+
+        buf.setData(QByteArray(data.tobytes()))
+
+        attr = Qt3DCore.QAttribute(self.geometry)
+
+        attr.setName(name)
+
+        attr.setAttributeType(Qt3DCore.QAttribute.VertexAttribute)
+
+        attr.setVertexBaseType(Qt3DCore.QAttribute.Float)
+
+        attr.setVertexSize(data.shape[1] if data.ndim > 1 else 1)
+
+        attr.setByteStride(data.strides[0])
+
+        attr.setCount(len(data))
+
+        attr.setDivisor(1)  # advance once per instance, not per vertex
+
+        attr.setBuffer(buf)
+
+        self.geometry.addAttribute(attr)
+
+        return buf
+
+
+
+    def _make_material(self, palette: np.ndarray, light_pos: QVector3D, scale: float) -> Qt3DRender.QMaterial:
+
+        material = Qt3DRender.QMaterial(self.entity)
+
+        program = Qt3DRender.QShaderProgram(material)
+
+        program.setVertexShaderCode(QByteArray(INSTANCED_VERT.encode()))
+
+        program.setFragmentShaderCode(QByteArray(INSTANCED_FRAG.encode()))
+
+        render_pass = Qt3DRender.QRenderPass(material)
+
+        render_pass.setShaderProgram(program)
+
+        technique = Qt3DRender.QTechnique(material)
+
+        api = technique.graphicsApiFilter()
+
+        api.setApi(Qt3DRender.QGraphicsApiFilter.OpenGL)
+
+        api.setProfile(Qt3DRender.QGraphicsApiFilter.CoreProfile)
+
+        api.setMajorVersion(3); api.setMinorVersion(3)
+
+        # Matched by the forward renderer's technique filter
+
+        key = Qt3DRender.QFilterKey(material)
+
+        key.setName('renderingStyle'); key.setValue('forward')
+
+        technique.addFilterKey(key)
+
+        technique.addRenderPass(render_pass)
+
+        effect = Qt3DRender.QEffect(material)
+
+        effect.addTechnique(technique)
+
+        material.setEffect(effect)
+
+        material.addParameter(Qt3DRender.QParameter('cubeletScale', scale, material))
+
+        material.addParameter(Qt3DRender.QParameter('lightPosition', light_pos, material))
+
+        self._rotParam = Qt3DRender.QParameter('sliceRotation', QMatrix4x4(), material)
+
+        self._axisParam = Qt3DRender.QParameter('sliceAxis', QVector3D(1,0,0), material)
+
+        self._coordParam = Qt3DRender.QParameter('sliceCoord', 0.0, material)
+
+        for param in (self._rotParam, self._axisParam, self._coordParam):
+
+            material.addParameter(param)
 
-        self.set_position(pos)
+        # One shared color per face mask instead of a color per cubelet
 
-        self.set_scale(scale)
+        colors = [QVector3D(*map(float, rgb)) for rgb in palette]
 
+        material.addParameter(Qt3DRender.QParameter('palette[0]', colors, material))
 
+        return material
 
-    def set_position(self, pos: Tuple[float,float,float]):
 
-        self.transform.setTranslation(QVector3D(*pos))
 
+    def upload_positions(self, lo: int=0, hi: int=-1):
 
+        """Push rows lo..hi (inclusive; hi=-1 means last) of self.positions to the GPU."""
 
-    def set_scale(self, s: float):
+        if hi < 0:
 
-        self.transform.setScale(s)
+            hi = len(self.positions) - 1
+
+        self._update_pos(lo*self._row, QByteArray(self.positions[lo:hi+1].tobytes()))
+
+
+
+    def set_active_slice(self, axis_vec: QVector3D, coord: float):
+
+        """Select the turning slice: instances whose centered position along axis_vec is `coord`."""
+
+        self._axisParam.setValue(axis_vec)
+
+        self._coordParam.setValue(float(coord))
+
+
+
+    def set_slice_rotation(self, m: QMatrix4x4):
+
+        """The one per-frame write while a slice turns."""
+
+        self._set_rotation(m)
 
 
 
@@ -432,35 +798,23 @@ class VoxelQtScene(QtWidgets.QWidget):
 
 
 
-        # Shared cube mesh
-
-        self.cubeMesh = Qt3DExtras.QCuboidMesh(self.rootEntity)
-
-        self.cubeMesh.setXExtent(1.0); self.cubeMesh.setYExtent(1.0); self.cubeMesh.setZExtent(1.0)
-
-
-
-        # Build entities for each outer cubelet
+        # All cubelets drawn as instances of one cube
 
-        self.cubelets: List[CubeletEntity] = []
+        self.instances = CubeletInstances(self.rootEntity, self.model.coords - np.float32(self.half),
 
-        for i, (x,y,z) in enumerate(self.model.coords):
+                                          self.model.masks, COLOR_TABLE,
 
-            mask = int(self.model.masks[i])
+                                          self.lightTransform.translation(), scale=0.92)
 
-            color = blend_colors(mask)
+        # A single draw covers the whole cube, so per-entity culling buys nothing
 
-            pos = (x-self.half, y-self.half, z-self.half)
-
-            ent = CubeletEntity(self.rootEntity, self.cubeMesh, color, pos, scale=0.92)
-
-            self.cubelets.append(ent)
+        self.view.defaultFrameGraph().setFrustumCullingEnabled(False)
 
 
 
         # --- Animation state ---
 
-        self.queue: List[Tuple[str,int,int]] = []  # expanded quarter-turns: (axis,index,dir=+1)
+        self.queue: List[Tuple[str,int,int,int]] = []  # one segment per move: (axis,index,dir=+1,quarter_count)
 
         self.animating = False
 
@@ -470,9 +824,15 @@ class VoxelQtScene(QtWidgets.QWidget):
 
         self.speed = 1.0  # multiplier
 
-        self.current_move = None  # (axis,index,dir)
+        self.current_move = None  # (axis,index,dir,quarter_count)
+
+        self.moving_indices = None  # int32 indices of moving cubelets
+
+        # Reused commit buffer for snapped slice positions, big enough for any slice
+
+        self._pos_buf = np.empty((n*n,3), dtype=np.float32)
 
-        self.moving_indices = None  # numpy mask of moving cubelets
+        self._rot = QMatrix4x4()  # current slice rotation, rebuilt in place every tick
 
 
 
@@ -482,9 +842,7 @@ class VoxelQtScene(QtWidgets.QWidget):
 
         self.timer.setInterval(16)
 
-        self.timer.timeout.connect(self._on_tick)
-
-        self.timer.start()
+        self.timer.timeout.connect(self._on_tick)  # started by enqueue_move, stopped when the queue drains
 
 
 
@@ -502,6 +860,22 @@ class VoxelQtScene(QtWidgets.QWidget):
 
 
 
+        # Compile the numba kernels now so the first move doesn't stutter
+
+        self._warm_up_kernels()
+
+
+
+    def _warm_up_kernels(self):
+
+        empty = np.empty(0, dtype=np.int32)
+
+        for fn in PERMUTE_FNS.values():
+
+            fn(self.model.cx, self.model.cy, empty, self.n - 1)
+
+
+
     # --- Controls handlers ---
 
     def on_speed_changed(self, value: int):
@@ -534,15 +908,9 @@ class VoxelQtScene(QtWidgets.QWidget):
 
         if seed_text:
 
-            # FNV-1a 32-bit hash
-
-            h = 2166136261
+            # 32-bit CRC of the text (C-coded in zlib)
 
-            for ch in seed_text:
-
-                h ^= ord(ch); h = (h * 16777619) & 0xffffffff
-
-            seed = h
+            seed = zlib.crc32(seed_text.encode('utf-8'))
 
         seq = self.model.scramble(moves, seed)
 
@@ -572,13 +940,17 @@ class VoxelQtScene(QtWidgets.QWidget):
 
         self.queue.clear(); self.animating=False; self.current_move=None
 
+        self.timer.stop()
+
         self.model.reset()
 
         # Snap visuals to solved
 
-        for i, (x,y,z) in enumerate(self.model.coords):
+        self.instances.positions[:] = self.model.coords - np.float32(self.half)
 
-            self.cubelets[i].set_position((x-self.half, y-self.half, z-self.half))
+        self.instances.upload_positions()
+
+        self.instances.set_slice_rotation(QMatrix4x4())
 
 
 
@@ -588,9 +960,13 @@ class VoxelQtScene(QtWidgets.QWidget):
 
         steps = k % 4
 
-        for _ in range(steps):
+        if steps:
+
+            self.queue.append((axis, index, +1, steps))
 
-            self.queue.append((axis, index, +1))
+            if not self.timer.isActive():
+
+                self.timer.start()
 
         if record:
 
@@ -608,111 +984,101 @@ class VoxelQtScene(QtWidgets.QWidget):
 
             self.moving_indices = None
 
+            self.timer.stop()  # idle: no ticks until the next move is queued
+
             return
 
         self.animating = True
 
         self.frame = 0
 
-        axis, index, dir_sign = self.queue.pop(0)
+        axis, index, dir_sign, qc = self.queue.pop(0)
 
-        self.current_move = (axis, index, dir_sign)
+        self.current_move = (axis, index, dir_sign, qc)
 
-        # Precompute which cubelets are in the slice
+        # The whole segment sweeps qc quarter-turns in one continuous tween
 
-        mask = self.model._slice_mask(axis, index)
+        self._target_angle = dir_sign * (math.pi/2.0) * qc
 
-        self.moving_indices = np.where(mask)[0]
+        self._commit_k = qc
 
+        # Cubelets in the slice, straight from the model's bucketed index table
 
+        self.moving_indices = self.model._slice_of[AXIS_INDEX[axis]][index]
 
-    def _on_tick(self):
+        self._axis_vec = AXIS_VEC[axis]
 
-        if not self.animating and self.queue:
-
-            self._start_next_turn()
-
-        if not self.animating:
-
-            return
+        # Contiguous instance-buffer row range covering the slice (rewritten on commit)
 
+        self._upload_lo = int(self.moving_indices.min())
 
+        self._upload_hi = int(self.moving_indices.max())
 
-        axis, index, dir_sign = self.current_move
+        # Hand the slice to the GPU; it follows sliceRotation (identity until the first tick)
 
-        # Interp 0..1 across the quarter-turn
+        self.instances.set_active_slice(self._axis_vec, index - self.half)
 
-        total_frames = max(1, int(self.frames_per_turn / self.speed))
-
-        t01 = self.frame / max(1, total_frames-1)
 
-        angle = dir_sign * (math.pi/2.0) * t01
 
+    def _on_tick(self):
 
+        if not self.animating and self.queue:
 
-        # Update positions for moving slice
-
-        h = self.half
-
-        c, s = math.cos(angle), math.sin(angle)
-
-
+            self._start_next_turn()
 
-        # For performance: update only moving cubelets' transforms
+        if not self.animating:
 
-        for i in self.moving_indices:
+            return
 
-            x, y, z = self.model.coords[i]
 
-            # base pos
 
-            px, py, pz = (x-h, y-h, z-h)
+        axis, index, dir_sign, qc = self.current_move
 
-            if axis == 'x':
+        # Interp 0..1 across the segment (same pace per quarter-turn)
 
-                ny = c*py - s*pz
+        total_frames = max(1, int(qc * self.frames_per_turn / self.speed))
 
-                nz = s*py + c*pz
+        last = self.frame + 1 >= total_frames
 
-                nx = px
+        t01 = self.frame / max(1, total_frames-1)
 
-            elif axis == 'y':
+        angle = t01 * self._target_angle
 
-                nx =  c*px + s*pz
 
-                nz = -s*px + c*pz
 
-                ny = py
+        self.frame += 1
 
-            else:  # 'z'
+        if last:
 
-                nx = c*px - s*py
+            # Commit rotation: snap integer coords, bake them into the instance
 
-                ny = s*px + c*py
+            # translations and reset sliceRotation (the cubelets stay in the slice)
 
-                nz = pz
+            self.model._rotate_slice_k(axis, index, dir_sign * self._commit_k)
 
-            self.cubelets[i].set_position((nx, ny, nz))
+            idx = self.moving_indices
 
+            self.instances.positions[idx] = self.model.centered_positions(idx, self._pos_buf)
 
+            self.instances.upload_positions(self._upload_lo, self._upload_hi)
 
-        self.frame += 1
+            self._rot.setToIdentity()
 
-        if self.frame >= total_frames:
+            self.instances.set_slice_rotation(self._rot)
 
-            # Commit rotation: snap integer coords and update visuals to new bases
+            # Next
 
-            self.model._rotate_slice_90(axis, index, dir_sign)
+            self._start_next_turn()
 
-            for i in self.moving_indices:
+        elif t01 > 0.0:
 
-                x,y,z = self.model.coords[i]
+            # One matrix per frame for the whole slice (frame 0 is the identity already set)
 
-                self.cubelets[i].set_position((x-h, y-h, z-h))
+            self._rot.setToIdentity()
 
-            # Next
+            self._rot.rotate(math.degrees(angle), self._axis_vec)
 
-            self._start_next_turn()
+            self.instances.set_slice_rotation(self._rot)
 
 
 